@@ -51,9 +51,13 @@ def build(lines: list[Line], cfg: Config) -> str:
 
     x = width // 2
     slots = [round(height * fraction) for fraction in _SLOTS]
+    texts = [_escape(line.text) for line in lines] # each line shows up to three times
 
+    previous, end = None, ""
     for i, line in enumerate(lines):
-        start, end = _timestamp(line.start), _timestamp(line.end)
+        # lines usually run back to back, so this start was just formatted as the last end
+        start = end if line.start == previous else _timestamp(line.start)
+        end, previous = _timestamp(line.end), line.end
         duration = int(max(line.end - line.start, 0.1) * 1000)
         rise = min(_TRANSITION_MS, duration // 2) # a short line still gets half of one
         begin = duration - rise if duration > rise else 0
@@ -68,8 +72,7 @@ def build(lines: list[Line], cfg: Config) -> str:
             # the middle slot never fades - it is already on screen either way
             fade = (rf"\fad(0,{fade_out})" if offset == 0 else
                     rf"\fad({fade_in},0)" if offset == 2 else "")
-            text = _escape(lines[i + offset].text)
-            doc.append(f"Dialogue: 0,{start},{end},{style},,0,0,0,,{{{move}{fade}}}{text}")
+            doc.append(f"Dialogue: 0,{start},{end},{style},,0,0,0,,{{{move}{fade}}}{texts[i + offset]}")
 
     return "\n".join(doc) + "\n"
 
@@ -6,7 +6,7 @@ from karaoke.errors import KaraokeError
 
 _PATH_FIELDS = ("work_dir", "out_dir", "cookie_file", "model_dir")  # to tell json loader which fields are Path objects
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     work_dir: Path = Path("work")
     out_dir: Path = Path("out")
@@ -17,7 +17,9 @@ class Config:
     font: str = "Montserrat"
     font_size: int = 88
     separation_model: str = "UVR-MDX-NET-Inst_HQ_4.onnx" # best model i found for speed / quality
+    separation_batch_size: int = 1 # mdx chunks per inference call; raise it on a gpu with memory to spare
     ffmpeg: str = "ffmpeg"
+    encoder: str = "auto" # a working hardware h264 encoder if there is one, else libx264
     cookie_file: Path | None = None
     cookies_from_browser: str | None = None
     model_dir: Path = Path("models")
@@ -11,13 +11,14 @@ from yt_dlp.utils import YoutubeDLError
 from karaoke.config import Config
 from karaoke.errors import KaraokeError
 from karaoke.models import Song
+from karaoke.paths import nonempty
 from karaoke.ydl import ydl_opts
 
 log = logging.getLogger(__name__)
 
 def download(song: Song, work_dir: Path, cfg: Config) -> Path:
     out = work_dir / "audio.mp3"
-    if out.exists() and out.stat().st_size:
+    if nonempty(out):
         log.info("audio already downloaded: %s", out)
         return out
 
@@ -45,7 +46,7 @@ def download(song: Song, work_dir: Path, cfg: Config) -> Path:
     except YoutubeDLError as e:
         raise KaraokeError(f"could not download {song.url} : {e}") from e
 
-    if not (tmp.exists() and tmp.stat().st_size):
+    if not nonempty(tmp):
         raise KaraokeError(f"download produced no audio for {song.url}")
 
     tmp.replace(out)
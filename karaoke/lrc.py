@@ -31,7 +31,9 @@ def parse(text: str, tail: float = 5.0, duration: float | None = None) -> list[L
             continue
 
         starts, rest = _split_stamps(raw)
-        body = _WORD.sub("", rest).strip() # word timing isnt used, only the words
+        if "<" in rest: # only enhanced lrc carries word stamps
+            rest = _WORD.sub("", rest) # word timing isnt used, only the words
+        body = rest.strip()
         if not (starts and body):
             continue
 
@@ -4,30 +4,58 @@ fetches line-level synced lyrics as an .lrc file
 
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import syncedlyrics
+from syncedlyrics.providers import Lrclib, NetEase
+from syncedlyrics.providers.base import LRCProvider
+from syncedlyrics.utils import TargetType
 
 from karaoke.errors import KaraokeError
 from karaoke.models import Song
+from karaoke.paths import nonempty
 
 log = logging.getLogger(__name__)
 
-_PROVIDERS = ["lrclib", "netease"]
+_PROVIDERS = [Lrclib, NetEase] # in order of preference
+
+def _fetch(provider: type[LRCProvider], query: str) -> str | None:
+    # same as syncedlyrics.search: a provider that errors just has no answer
+    try:
+        lyrics = provider().get_lrc(query)
+    except Exception as e:
+        log.warning("lyrics lookup on %s failed: %s", provider.__name__, e)
+        return None
+    return lyrics.synced if lyrics and lyrics.is_preferred(TargetType.SYNCED_ONLY) else None
+
+def _search(query: str) -> str | None:
+    """asks every provider at once; the list order still decides whose answer wins.
+    the provider classes are called directly, since search() builds all of them on every call"""
+    pool = ThreadPoolExecutor(max_workers=len(_PROVIDERS))
+    try:
+        jobs = [pool.submit(_fetch, provider, query) for provider in _PROVIDERS]
+        for job in jobs:
+            if (lrc := job.result()) and lrc.strip():
+                return lrc
+        return None
+    finally:
+        # dont wait on a slower lookup; it cant be cancelled once running, so it is left to
+        # finish (within the (2, 10)s request timeouts) and exit waits for it if need be
+        pool.shutdown(wait=False)
 
 def get_lyrics(song: Song, work_dir: Path, lrc_file: Path | None = None) -> Path:
     out = work_dir / "lyrics.lrc"
     tmp = work_dir / "lyrics.tmp.lrc"
 
     if lrc_file is not None:
-        if not (lrc_file.exists() and lrc_file.stat().st_size):
+        if not nonempty(lrc_file):
             raise KaraokeError(f"no lyrics in {lrc_file}")
         shutil.copyfile(lrc_file, tmp) # bytes as-is; encoding is lrc.py's problem
         tmp.replace(out) # an explicit --lrc-file wins over a cached fetch
         log.info("lyrics copied from %s", lrc_file)
         return out
 
-    if out.exists() and out.stat().st_size:
+    if nonempty(out):
         log.info("lyrics already fetched: %s", out)
         return out
 
@@ -35,7 +63,7 @@ def get_lyrics(song: Song, work_dir: Path, lrc_file: Path | None = None) -> Path
     log.info("searching lyrics for %s", query)
 
     try:
-        lrc = syncedlyrics.search(query, synced_only=True, providers=_PROVIDERS)
+        lrc = _search(query)
     except Exception as e:
         raise KaraokeError(f"lyrics searched failed for {query} : {e}") from e
 
@@ -43,7 +71,7 @@ def get_lyrics(song: Song, work_dir: Path, lrc_file: Path | None = None) -> Path
     if not (lrc and lrc.strip()):
         raise KaraokeError(f"no synced lyrics found for {query}; pass --lrc-file to supply your own")
 
-    tmp.write_text(lrc, encoding="utf-8")
+    tmp.write_bytes(lrc.encode("utf-8")) # as fetched; text mode would rewrite \n on windows
     tmp.replace(out)
     log.info("lyrics ready : %s (%d lines)", out, len(lrc.splitlines()))
 
@@ -21,6 +21,8 @@ from karaoke.models import Song
 from karaoke.paths import work_dir_for
 
 _SEARCH_LIMIT = 10
+# only the tags are read here; the stream manifests are download.py's business
+_METADATA_ONLY = {"youtube": {"skip": ["hls", "dash", "translated_subs"]}}
 
 log = logging.getLogger(__name__)
 _URL = re.compile(r"^https?://([\w-]+\.)*(youtube\.com|youtu\.be)/", re.I)
@@ -36,7 +38,9 @@ def _pick_track(entries: list[dict]) -> str | None:
     return None
 
 def _parse_title(title: str) -> tuple[str, str] | None:
-    parts = _SEP.split(_BRACKETED.sub(" ", title), maxsplit=1)
+    if "(" in title or "[" in title or "{" in title: # most titles carry no tags
+        title = _BRACKETED.sub(" ", title)
+    parts = _SEP.split(title, maxsplit=1)
     if len(parts) != 2:
         return None
     artist, track = [p.strip(" \t\"'") for p in parts]
@@ -64,7 +68,9 @@ def _search(query: str, cfg: Config) -> str:
     raise KaraokeError(f"no track results for {query!r}")
 
 def _extract_video(url: str, cfg: Config) -> dict:
-    info = _extract(url, cfg, noplaylist=True)
+    # with the manifests skipped, some videos have no playable format left; the tags are still there
+    info = _extract(url, cfg, noplaylist=True, extractor_args=_METADATA_ONLY,
+        ignore_no_formats_error=True)
     if info.get("_type") in ("playlist", "multi_video"):
         raise KaraokeError(f"expected a single track, got a playlist: {url}")
     return info
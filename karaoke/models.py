@@ -1,13 +1,13 @@
 from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(slots=True)
 class Song:
     artist: str
     track: str
     url: str
     duration: float | None = None
 
-@dataclass
+@dataclass(slots=True)
 class Line:
     start: float
     end: float
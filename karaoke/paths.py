@@ -11,3 +11,10 @@ def slug(artist: str, track: str) -> str:
 
 def work_dir_for(root: Path, artist: str, track: str) -> Path:
     return root / slug(artist, track)
+
+def nonempty(path: Path) -> bool:
+    """one stat instead of exists() then stat(); every stage's cache check goes through here"""
+    try:
+        return path.stat().st_size > 0
+    except OSError:
+        return False
@@ -4,6 +4,7 @@ runs every stage in order and hands back the finished videos
 
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 
@@ -29,6 +30,9 @@ def _read(path: Path) -> str:
 def run(query: str, cfg: Config, *, lrc_file: Path | None = None,
     instrumental_only: bool = False, force: bool = False) -> dict[str, Path]:
 
+        # both renders share it, and the probes shouldnt run twice at once
+        encoder = render.pick_encoder(cfg)
+
         song, wd = meta.get_song(query, cfg.work_dir, cfg)
 
         if force:
@@ -43,16 +47,30 @@ def run(query: str, cfg: Config, *, lrc_file: Path | None = None,
             raise KaraokeError(f"no timed lines in {lrc_path}; pass --lrc-file for supply your own")
 
         subs = wd / "subs.ass"
-        subs.write_text(ass.build(lines, cfg), encoding = "utf-8")
+        subs.write_bytes(ass.build(lines, cfg).encode("utf-8")) # one encode, no newline translation
         log.info("subtitles ready : %s (%d lines)", subs, len(lines))
 
         audio = download.download(song, wd, cfg)
         instrumental = audio if instrumental_only else separate.separate(audio, wd, cfg)
 
-        out = {"karaoke" : render.render(instrumental, subs,
-            cfg.out_dir / f"{wd.name}_karaoke.mp4", cfg)}
-
+        sources = {"karaoke": instrumental}
         if cfg.both_versions and not instrumental_only:
-            out["original"] = render.render(audio, subs, cfg.out_dir / f"{wd.name}_original.mp4", cfg)
-
-        return out
+            sources["original"] = audio
+
+        # each encode is its own ffmpeg process, so plain threads are enough to overlap them
+        with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+            jobs = {pool.submit(render.render, source, subs,
+                cfg.out_dir / f"{wd.name}_{name}.mp4", cfg, encoder): name for name, source in sources.items()}
+            try:
+                for job in as_completed(jobs):
+                    job.result() # the first failure, whichever render it is
+            except Exception:
+                # a running ffmpeg cant be stopped from here, so the other encode is waited
+                # out; its video goes too, so a failed run leaves no half set in out_dir
+                pool.shutdown()
+                for job in jobs:
+                    if job.exception() is None:
+                        job.result().unlink(missing_ok=True)
+                raise
+
+        return {name: job.result() for job, name in jobs.items()}
@@ -2,24 +2,58 @@
 burns the subtitles over a solid background and muxes in the audio
 """
 
+import functools
 import logging
 import subprocess
 import time
+from collections import deque
 from pathlib import Path
 
 from karaoke.config import Config
 from karaoke.errors import KaraokeError
+from karaoke.paths import nonempty
 
 log = logging.getLogger(__name__)
 
 _STDERR_LINES = 20
 
-def _tail(stderr: str) -> str:
-    return "\n".join(stderr.strip().splitlines()[-_STDERR_LINES:])
+# quality flags per encoder, each aimed at roughly what crf 18 gives libx264
+_ENCODERS = {
+    "libx264": ["-preset", "medium", "-crf", "18"],
+    "h264_nvenc": ["-preset", "p4", "-rc", "vbr", "-cq", "19", "-b:v", "0"],
+    "h264_qsv": ["-preset", "medium", "-global_quality", "20"],
+    "h264_videotoolbox": ["-q:v", "65"],
+}
+_HARDWARE = ("h264_nvenc", "h264_qsv", "h264_videotoolbox") # tried in this order by "auto"
 
-def render(audio: Path, subs: Path, out_path: Path, cfg: Config) -> Path:
+def _video_args(encoder: str) -> list[str]:
+    return ["-c:v", encoder, *_ENCODERS[encoder],
+        "-pix_fmt", "yuv420p"] # 4:2:0 or it wont play on a phone (will need to double check this)
+
+@functools.cache
+def _works(ffmpeg: str, encoder: str) -> bool:
+    """being listed by ffmpeg -encoders isnt enough; builds ship nvenc with no gpu to drive it.
+    probes with the exact flags render uses, since some builds reject those and not the encoder"""
+    cmd = [ffmpeg, "-hide_banner", "-nostdin", "-f", "lavfi", "-i", "color=s=256x256",
+        "-frames:v", "1", *_video_args(encoder), "-f", "null", "-"]
+    try:
+        return subprocess.run(cmd, capture_output=True, timeout=30).returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+def pick_encoder(cfg: Config) -> str:
+    """resolved once per run, before the slow stages, so a typo fails in seconds"""
+    if cfg.encoder == "auto":
+        encoder = next((name for name in _HARDWARE if _works(cfg.ffmpeg, name)), "libx264")
+        log.info("encoding with %s", encoder) # auto changes the quality flags too, so say which
+        return encoder
+    if cfg.encoder not in _ENCODERS:
+        raise KaraokeError(f"encoder must be auto or one of {', '.join(_ENCODERS)}, got {cfg.encoder!r}")
+    return cfg.encoder
+
+def render(audio: Path, subs: Path, out_path: Path, cfg: Config, encoder: str) -> Path:
     for path in (audio, subs):
-        if not (path.exists() and path.stat().st_size):
+        if not nonempty(path):
             raise KaraokeError(f"nothing to render: {path}")
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -31,8 +65,7 @@ def render(audio: Path, subs: Path, out_path: Path, cfg: Config) -> Path:
         "-i", str(audio.resolve()),
         "-map", "0:v", "-map", "1:a", # not letting ffmpeg guess; cover art is a video stream
         "-vf", f"ass={subs.name}", # bare name, ffmpeg will run inside the subs dir
-        "-c:v", "libx264", "-preset", "medium", "-crf", "18",
-        "-pix_fmt", "yuv420p", # 4:2:0 or it wont play on a phone (will need to double check this)
+        *_video_args(encoder),
         "-c:a", "aac", "-b:a", "320k",
         "-shortest",
         str(tmp.resolve())
@@ -43,16 +76,20 @@ def render(audio: Path, subs: Path, out_path: Path, cfg: Config) -> Path:
 
     try:
         # subs.parent exists (we checked subs above)
-        done = subprocess.run(cmd, cwd=subs.parent, capture_output=True,
-            text=True, errors="replace")
+        proc = subprocess.Popen(cmd, cwd=subs.parent, stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE, text=True, errors="replace")
     except FileNotFoundError as e:
         raise KaraokeError("ffmpeg not found - install it or set ffmpeg in config") from e
 
-    if done.returncode:
+    # progress streams out for the whole encode; only the last lines explain a failure
+    with proc:
+        tail = deque(proc.stderr, maxlen=_STDERR_LINES)
+
+    if proc.returncode:
         tmp.unlink(missing_ok=True)
-        raise KaraokeError(f"ffmpeg failed for {out_path}:\n{_tail(done.stderr)}")
+        raise KaraokeError(f"ffmpeg failed for {out_path}:\n{''.join(tail).strip()}")
 
-    if not (tmp.exists() and tmp.stat().st_size):
+    if not nonempty(tmp):
         raise KaraokeError(f"ffmpeg produced no video for {out_path}")
 
     tmp.replace(out_path)
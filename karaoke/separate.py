@@ -2,22 +2,27 @@ import logging
 import time
 from pathlib import Path
 
-from audio_separator.separator import Separator
-
 from karaoke.config import Config
 from karaoke.errors import KaraokeError
+from karaoke.paths import nonempty
 
 log = logging.getLogger(__name__)
 
+# audio-separator's own mdx defaults; passing mdx_params replaces them all, so all are restated
+_MDX_PARAMS = {"hop_length": 1024, "segment_size": 256, "overlap": 0.25, "enable_denoise": False}
+
 def separate(audio: Path, work_dir: Path, cfg: Config) -> Path:
     out = work_dir / "instrumental.wav"
-    if out.exists() and out.stat().st_size:
+    if nonempty(out):
         log.info("instrumental already separated: %s", out)
         return out
 
-    if not (audio.exists() and audio.stat().st_size):
+    if not nonempty(audio):
         raise KaraokeError(f"no audio to separate: {audio}")
 
+    # torch and onnxruntime load with it; a cached or skipped separation never pays that
+    from audio_separator.separator import Separator
+
     log.info("separating %s with %s", audio.name, cfg.separation_model)
     log.info("the first run downloads the model and is slow")
     t0 = time.monotonic()
@@ -26,8 +31,10 @@ def separate(audio: Path, work_dir: Path, cfg: Config) -> Path:
         separator = Separator(
             output_dir=str(work_dir),
             output_format="WAV",
+            output_single_stem="Instrumental", # the vocals stem would only be written to be deleted
             model_file_dir=str(cfg.model_dir),
             log_level=logging.INFO,
+            mdx_params=_MDX_PARAMS | {"batch_size": cfg.separation_batch_size},
         )
         separator.load_model(model_filename=cfg.separation_model)
         names = separator.separate(str(audio))
@@ -35,13 +42,14 @@ def separate(audio: Path, work_dir: Path, cfg: Config) -> Path:
         raise KaraokeError(f"could not separate {audio.name} : {e}") from e
 
     stems = [work_dir / name for name in names] # the library returns bare filenames
-    instrumental = next((p for p in stems if "instrumental" in p.name.lower()), None)
-    if not (instrumental and instrumental.exists() and instrumental.stat().st_size):
+    # names look like audio_(Instrumental)_<model>.wav; the model name may say instrumental too
+    instrumental = next((p for p in stems if "_(instrumental)" in p.name.lower()), None)
+    if not (instrumental and nonempty(instrumental)):
         raise KaraokeError(f"no instrumental stem produced for {audio.name}; got {names}")
 
     for stem in stems:
         if stem != instrumental:
-            stem.unlink(missing_ok=True) # we dont need vocals
+            stem.unlink(missing_ok=True) # models that ignore output_single_stem still emit vocals
 
     instrumental.replace(out)
     log.info("instrumental ready: %s (%.1f MB, %.0fs)",
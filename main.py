@@ -4,8 +4,6 @@ import sys
 from pathlib import Path
 import time
 
-from karaoke import pipeline
-
 from karaoke.config import Config
 from karaoke.errors import KaraokeError
 
@@ -32,9 +30,10 @@ def main(argv : list[str] | None = None) -> int:
     t0 = time.monotonic()
 
     try:
+        from karaoke import pipeline # drags in yt-dlp; --help and bad arguments never need it
         cfg = Config.load(args.config)
-        print("args:", vars(args))
-        print("config:", cfg)
+        log.debug("args: %s", vars(args))
+        log.debug("config: %s", cfg)
         videos = pipeline.run(
             args.query, cfg, lrc_file=args.lrc_file, instrumental_only=args.instrumental_only, force=args.force
         )
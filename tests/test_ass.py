@@ -0,0 +1,70 @@
+import pytest
+
+from karaoke.ass import _dimensions, _escape, _timestamp, build
+from karaoke.config import Config
+from karaoke.errors import KaraokeError
+from karaoke.models import Line
+
+LINES = [
+    Line(1.0, 2.0, "one"),
+    Line(2.0, 4.0, "two {x}"),
+    Line(4.0, 9.0, "three"),
+]
+
+
+def _dialogues(doc: str) -> list[str]:
+    return [row for row in doc.splitlines() if row.startswith("Dialogue:")]
+
+
+@pytest.mark.parametrize("seconds,expected", [
+    (0,        "0:00:00.00"),
+    (59.999,   "0:01:00.00"),
+    (61.25,    "0:01:01.25"),
+    (3723.5,   "1:02:03.50"),
+    (-1,       "0:00:00.00"),
+])
+def test_timestamp(seconds, expected):
+    assert _timestamp(seconds) == expected
+
+
+@pytest.mark.parametrize("resolution,expected", [
+    ("1920x1080",   (1920, 1080)),
+    (" 1280X720 ",  (1280, 720)),
+])
+def test_dimensions(resolution, expected):
+    assert _dimensions(resolution) == expected
+
+
+def test_dimensions_rejects_garbage():
+    with pytest.raises(KaraokeError, match="resolution"):
+        _dimensions("1080p")
+
+
+def test_escape():
+    assert _escape(r"a\b {c}") == r"a\\b \{c\}"
+
+
+def test_build_previews_the_next_two_lines():
+    rows = _dialogues(build(LINES, Config()))
+
+    assert len(rows) == 3 + 2 + 1 # the tail has fewer lines left to preview
+    assert rows[0] == (r"Dialogue: 0,0:00:01.00,0:00:02.00,Current,,0,0,0,,"
+                       r"{\move(960,520,960,400,700,1000)\fad(0,300)}one")
+    assert rows[1] == (r"Dialogue: 0,0:00:01.00,0:00:02.00,Next,,0,0,0,,"
+                       r"{\move(960,660,960,520,700,1000)}two \{x\}")
+    assert rows[2] == (r"Dialogue: 0,0:00:01.00,0:00:02.00,Next2,,0,0,0,,"
+                       r"{\move(960,800,960,660,700,1000)\fad(100,0)}three")
+    assert rows[-1].startswith("Dialogue: 0,0:00:04.00,0:00:09.00,Current,")
+
+
+def test_build_scales_to_resolution():
+    doc = build(LINES, Config(resolution="1280x720"))
+    assert "PlayResX: 1280\nPlayResY: 720" in doc
+    assert r"\move(640,440,640,347," in doc
+
+
+def test_build_times_lines_that_do_not_touch():
+    rows = _dialogues(build([Line(1.0, 2.0, "a"), Line(3.0, 4.0, "b")], Config()))
+    assert [row.split(",")[1:3] for row in rows] == [
+        ["0:00:01.00", "0:00:02.00"], ["0:00:01.00", "0:00:02.00"],
+        ["0:00:03.00", "0:00:04.00"]]
@@ -0,0 +1,51 @@
+import pytest
+
+from karaoke.lrc import _MARKER, _split_stamps, parse
+
+
+def _texts(text: str, **kwargs) -> list[str]:
+    return [line.text for line in parse(text, **kwargs)]
+
+
+@pytest.mark.parametrize("raw,expected", [
+    ("[00:12.50]hello",           ([12.5], "hello")),
+    ("[01:02]hi",                 ([62.0], "hi")),
+    ("[00:01.00][00:30.00]chorus", ([1.0, 30.0], "chorus")),
+    ("[9:99]bad stamp",           ([], "bad stamp")),
+    ("no stamp",                  ([], "no stamp")),
+])
+def test_split_stamps(raw, expected):
+    assert _split_stamps(raw) == expected
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("[00:01.00]plain line",                           ["plain line"]),
+    ("[00:01.00]<00:01.00>word <00:01.50>level",       ["word level"]),
+    ("[00:01.00] <00:01.00> ",                         []),
+    ("[00:01.00]a < b",                                ["a < b"]),
+    ("[ar:Adele]\n[ti:Hello]\n[00:01.00]hello",        ["hello"]),
+    ("[00:01.00]crlf\r\n[00:02.00]line\r\n",           ["crlf", "line"]),
+])
+def test_parse_text(text, expected):
+    assert _texts(text) == expected
+
+
+def test_parse_counts_in_a_late_first_line():
+    assert _texts("[00:10.00]go") == ["3", "2", "1", "go"]
+
+
+def test_parse_marks_long_gaps():
+    lines = parse("[00:01.00]before\n[00:30.00]after")
+    assert [line.text for line in lines] == ["before", _MARKER, "after"]
+    assert lines[0].end == lines[1].start == 11.0
+
+
+def test_parse_marks_a_long_outro_only_with_duration():
+    assert _texts("[00:01.00]last")[-1] == "last"
+    assert _texts("[00:01.00]last", duration=60)[-1] == _MARKER
+
+
+def test_parse_sorts_repeated_stamps():
+    lines = parse("[00:01.00][00:03.00]chorus\n[00:02.00]verse")
+    assert [(line.start, line.text) for line in lines] == [
+        (1.0, "chorus"), (2.0, "verse"), (3.0, "chorus")]
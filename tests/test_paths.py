@@ -0,0 +1,25 @@
+import pytest
+
+from karaoke.paths import nonempty, slug
+
+
+@pytest.mark.parametrize("artist,track,expected", [
+    ("Adele",     "Hello",              "Adele_Hello"),
+    ("AC/DC",     "Thunderstruck",      "ACDC_Thunderstruck"),
+    ("Sigur Rós", "Hoppípolla",         "Sigur_Rós_Hoppípolla"),
+    ("a-ha",      "Take On Me",         "a-ha_Take_On_Me"),
+    ("  ",        "?!",                 "untitled"),
+])
+def test_slug(artist, track, expected):
+    assert slug(artist, track) == expected
+
+
+def test_nonempty(tmp_path):
+    full = tmp_path / "full.mp3"
+    full.write_bytes(b"x")
+    empty = tmp_path / "empty.mp3"
+    empty.touch()
+
+    assert nonempty(full) is True
+    assert nonempty(empty) is False
+    assert nonempty(tmp_path / "missing.mp3") is False
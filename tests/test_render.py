@@ -0,0 +1,31 @@
+import pytest
+
+from karaoke import render
+from karaoke.config import Config
+from karaoke.errors import KaraokeError
+
+
+@pytest.fixture
+def working(monkeypatch):
+    """stands in for the ffmpeg probe; holds the encoders that pass it"""
+    passing = set()
+    monkeypatch.setattr(render, "_works", lambda ffmpeg, encoder: encoder in passing)
+    return passing
+
+
+def test_auto_falls_back_to_libx264(working):
+    assert render.pick_encoder(Config()) == "libx264"
+
+
+def test_auto_takes_the_first_working_hardware_encoder(working):
+    working.update({"h264_qsv", "h264_videotoolbox"})
+    assert render.pick_encoder(Config()) == "h264_qsv"
+
+
+def test_explicit_encoder_is_not_probed(working):
+    assert render.pick_encoder(Config(encoder="h264_nvenc")) == "h264_nvenc"
+
+
+def test_unknown_encoder_raises(working):
+    with pytest.raises(KaraokeError, match="encoder"):
+        render.pick_encoder(Config(encoder="x264"))